@@ -1,4 +1,3 @@
-import distutils.version
 import uuid
 import warnings
 from copy import deepcopy
@@ -8,10 +7,13 @@ from typing import Optional
 import neo.io.baseio
 import numpy as np
 import pynwb
+from packaging.version import Version
 from pydantic import FilePath
 
 from ..nwb_helpers import add_device_from_metadata
 
+_PYNWB_SUPPORTS_NEO_WRITING = Version(pynwb.__version__) >= Version("1.3.3")
+
 response_classes = dict(
     voltage_clamp=pynwb.icephys.VoltageClampSeries,
     current_clamp=pynwb.icephys.CurrentClampSeries,
@@ -513,7 +515,7 @@ def write_neo_to_nwb(
         assert isinstance(nwbfile, pynwb.NWBFile), "'nwbfile' should be of type pynwb.NWBFile"
 
     assert (
-        distutils.version.LooseVersion(pynwb.__version__) >= "1.3.3"
+        _PYNWB_SUPPORTS_NEO_WRITING
     ), "'write_neo_to_nwb' not supported for version < 1.3.3. Run pip install --upgrade pynwb"
 
     assert save_path is None or nwbfile is None, "Either pass a save_path location, or nwbfile object, but not both!"
@@ -551,10 +553,12 @@ def write_neo_to_nwb(
             else:
                 nwbfile_kwargs = dict(
                     session_description="Auto-generated by NwbRecordingExtractor without description.",
-                    identifier=str(uuid.uuid4()),
                 )
                 if metadata is not None and "NWBFile" in metadata:
                     nwbfile_kwargs.update(metadata["NWBFile"])
+                # A random identifier is only generated when the metadata does not provide one
+                if "identifier" not in nwbfile_kwargs:
+                    nwbfile_kwargs["identifier"] = str(uuid.uuid4())
                 nwbfile = pynwb.NWBFile(**nwbfile_kwargs)
 
             add_neo_to_nwb(nwbfile=nwbfile, **kwargs)
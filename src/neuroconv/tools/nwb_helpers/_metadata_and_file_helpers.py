@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Literal, Optional
 from warnings import warn
 
+import h5py
 from hdmf_zarr import NWBZarrIO
 from pydantic import FilePath
 from pynwb import NWBHDF5IO, NWBFile
@@ -21,6 +22,12 @@ from ...utils.json_schema import validate_metadata
 
 BACKEND_NWB_IO = dict(hdf5=NWBHDF5IO, zarr=NWBZarrIO)
 
+# Chunk cache of the HDF5 files opened by make_or_load_nwbfile; large enough to hold a full row of the default
+# 10 MB ElectricalSeries chunks across a few hundred channels, with a large prime number of hash table slots so that
+# cached chunks rarely collide
+_HDF5_CHUNK_CACHE_NBYTES = 64 * 1024**2
+_HDF5_CHUNK_CACHE_NSLOTS = 100_003
+
 
 def get_module(nwbfile: NWBFile, name: str, description: str = None):
     """Check if processing module exists. If not, create it. Then return module."""
@@ -160,6 +167,34 @@ def _attempt_cleanup_of_existing_nwbfile(nwbfile_path: Path) -> None:
         warn(message=message, stacklevel=2)
 
 
+def _configure_hdf5_metadata_cache(file: h5py.File, cache_size_in_bytes: int = 128 * 1024**2) -> None:
+    """
+    Set a fixed size for the metadata cache of an open HDF5 file.
+
+    NWB files hold many small objects (table columns, attributes, links), and the default metadata cache of HDF5
+    starts at 2 MB and resizes adaptively while they are being written. Fixing the cache to a larger size avoids
+    the repeated evictions and resizing.
+
+    Parameters
+    ----------
+    file : h5py.File
+        The open HDF5 file to configure.
+    cache_size_in_bytes : int, default: 128 MB
+        The size of the metadata cache.
+    """
+    # The HDF5 constants for disabling the automatic resizing (H5C_incr__off, H5C_flash_incr__off, H5C_decr__off)
+    # are all zero and not exposed by h5py
+    cache_config = file.id.get_mdc_config()
+    cache_config.set_initial_size = True
+    cache_config.initial_size = cache_size_in_bytes
+    cache_config.min_size = cache_size_in_bytes
+    cache_config.max_size = cache_size_in_bytes
+    cache_config.incr_mode = 0
+    cache_config.flash_incr_mode = 0
+    cache_config.decr_mode = 0
+    file.id.set_mdc_config(cache_config)
+
+
 @contextmanager
 def make_or_load_nwbfile(
     nwbfile_path: Optional[FilePath] = None,
@@ -203,7 +238,8 @@ def make_or_load_nwbfile(
         "You must specify either an 'nwbfile_path', or an in-memory 'nwbfile' object, "
         "or provide the metadata for creating one."
     )
-    assert not (overwrite is False and nwbfile_path_in and nwbfile_path_in.exists() and nwbfile is not None), (
+    file_initially_exists = nwbfile_path_in.exists() if nwbfile_path_is_provided else False
+    assert not (overwrite is False and file_initially_exists and nwbfile is not None), (
         "'nwbfile_path' exists at location, 'overwrite' is False (append mode), but an in-memory 'nwbfile' object was "
         "passed! Cannot reconcile which nwbfile object to write."
     )
@@ -212,7 +248,6 @@ def make_or_load_nwbfile(
         raise NotImplementedError("Appending a Zarr file is not yet supported!")
 
     load_kwargs = dict()
-    file_initially_exists = nwbfile_path_in.exists() if nwbfile_path_is_provided else False
     append_mode = file_initially_exists and not overwrite
     if nwbfile_path_is_provided:
         load_kwargs.update(path=str(nwbfile_path_in))
@@ -238,7 +273,22 @@ def make_or_load_nwbfile(
         else:
             load_kwargs.update(mode="w")
 
-        io = backend_io_class(**load_kwargs)
+        if backend == "hdf5":
+            file = h5py.File(
+                name=load_kwargs["path"],
+                mode=load_kwargs["mode"],
+                rdcc_nbytes=_HDF5_CHUNK_CACHE_NBYTES,
+                rdcc_nslots=_HDF5_CHUNK_CACHE_NSLOTS,
+            )
+            try:
+                _configure_hdf5_metadata_cache(file=file)
+                load_kwargs.update(file=file)
+                io = backend_io_class(**load_kwargs)
+            except Exception:
+                file.close()
+                raise
+        else:
+            io = backend_io_class(**load_kwargs)
 
     read_nwbfile = nwbfile_path_is_provided and append_mode
     create_nwbfile = not read_nwbfile and not nwbfile_is_provided
@@ -254,8 +304,6 @@ def make_or_load_nwbfile(
             if metadata is None:
                 error_msg = "Metadata is required for creating an nwbfile "
                 raise ValueError(error_msg)
-            default_metadata = get_default_nwbfile_metadata()
-            default_metadata.deep_update(metadata)
 
             nwbfile = make_nwbfile_from_metadata(metadata=metadata)
 
@@ -1,11 +1,13 @@
+import mmap
 import uuid
 import warnings
 from collections import defaultdict
-from typing import Any, Literal, Optional, Union
+from typing import Any, Iterator, Literal, Optional, Union
 
 import numpy as np
 import psutil
 import pynwb
+from hdmf.common import VectorData, VectorIndex
 from hdmf.data_utils import AbstractDataChunkIterator, DataChunkIterator
 from pydantic import FilePath
 from spikeinterface import BaseRecording, BaseSorting, SortingAnalyzer
@@ -41,7 +43,7 @@ def _get_nwb_metadata(recording: BaseRecording, metadata: dict = None):
             Device=[dict(name="Device", description="Ecephys probe. Automatically generated.")],
             ElectrodeGroup=[
                 dict(name=str(group_name), description="no description", location="unknown", device="Device")
-                for group_name in np.unique(recording.get_channel_groups())
+                for group_name in np.unique(recording.get_channel_groups()).tolist()
             ],
         ),
     )
@@ -154,16 +156,19 @@ def add_electrode_groups_to_nwbfile(recording: BaseRecording, nwbfile: pynwb.NWB
 
     add_devices_to_nwbfile(nwbfile=nwbfile, metadata=metadata)
 
+    # Defaults follow the order in which the groups first appear
     group_names = _get_group_name(recording=recording)
+    unique_group_names = list(dict.fromkeys(group_names.tolist()))
 
+    default_device_name = next(iter(nwbfile.devices.values())).name
     defaults = [
         dict(
             name=group_name,
             description="no description",
             location="unknown",
-            device=[i.name for i in nwbfile.devices.values()][0],
+            device=default_device_name,
         )
-        for group_name in group_names
+        for group_name in unique_group_names
     ]
 
     if "ElectrodeGroup" not in metadata["Ecephys"]:
@@ -261,6 +266,31 @@ def _get_group_name(recording: BaseRecording) -> np.ndarray:
     return group_names
 
 
+def _get_channel_global_ids(channel_names: np.ndarray, group_names: np.ndarray) -> list[str]:
+    """
+    Combine channel and group names into the global identifiers used to map electrodes across writing operations.
+
+    The names are converted to Python objects in one pass before formatting, which avoids boxing every element
+    of the arrays into a NumPy scalar.
+
+    Parameters
+    ----------
+    channel_names : np.ndarray
+        The channel names of each electrode.
+    group_names : np.ndarray
+        The group names of each electrode.
+
+    Returns
+    -------
+    list[str]
+        A list with one `{channel_name}_{group_name}` key per electrode.
+    """
+    channel_names = np.asarray(channel_names).tolist()
+    group_names = np.asarray(group_names).tolist()
+
+    return [f"{ch_name}_{gr_name}" for ch_name, gr_name in zip(channel_names, group_names)]
+
+
 def _get_electrodes_table_global_ids(nwbfile: pynwb.NWBFile) -> list[str]:
     """
     Generate a list of global identifiers for channels in the electrode table of an NWB file.
@@ -288,7 +318,7 @@ def _get_electrodes_table_global_ids(nwbfile: pynwb.NWBFile) -> list[str]:
 
     channel_names = nwbfile.electrodes["channel_name"][:]
     group_names = nwbfile.electrodes["group_name"][:]
-    unique_keys = [f"{ch_name}_{gr_name}" for ch_name, gr_name in zip(channel_names, group_names)]
+    unique_keys = _get_channel_global_ids(channel_names=channel_names, group_names=group_names)
 
     return unique_keys
 
@@ -318,9 +348,37 @@ def _get_electrode_table_indices_for_recording(recording: BaseRecording, nwbfile
 
     channel_names = _get_channel_name(recording=recording)
     group_names = _get_group_name(recording=recording)
-    channel_global_ids = [f"{ch_name}_{gr_name}" for ch_name, gr_name in zip(channel_names, group_names)]
-    table_global_ids = _get_electrodes_table_global_ids(nwbfile=nwbfile)
-    electrode_table_indices = [table_global_ids.index(ch_id) for ch_id in channel_global_ids]
+    channel_global_ids = _get_channel_global_ids(channel_names=channel_names, group_names=group_names)
+    electrode_table_indices = _get_electrode_table_indices_for_global_ids(
+        channel_global_ids=channel_global_ids, nwbfile=nwbfile
+    )
+
+    return electrode_table_indices
+
+
+def _get_electrode_table_indices_for_global_ids(channel_global_ids: list[str], nwbfile: pynwb.NWBFile) -> list[int]:
+    """
+    Get the indices of the electrodes in the NWBFile that correspond to already computed channel global ids.
+
+    Parameters
+    ----------
+    channel_global_ids : list[str]
+        The global identifiers of the channels, as returned by `_get_channel_global_ids`.
+    nwbfile : pynwb.NWBFile
+        The NWBFile containing the electrodes table to search for matches.
+
+    Returns
+    -------
+    list[int]
+        A list of indices corresponding to the positions in the NWBFile's electrodes
+        table that match the given global ids.
+    """
+    # Keep the first row for each global id
+    table_global_id_to_index = dict()
+    for index, table_global_id in enumerate(_get_electrodes_table_global_ids(nwbfile=nwbfile)):
+        table_global_id_to_index.setdefault(table_global_id, index)
+
+    electrode_table_indices = [table_global_id_to_index[ch_id] for ch_id in channel_global_ids]
 
     return electrode_table_indices
 
@@ -480,6 +538,7 @@ def add_electrodes_to_nwbfile(
     # 1. Build columns details from extractor properties: dict(name: dict(description='',data=data, index=False))
     data_to_add = dict()
 
+    num_channels = recording.get_num_channels()
     recording_properties = recording.get_property_keys()
     spikeinterface_special_cases = [
         "offset_to_uV",  # Written in the ElectricalSeries
@@ -527,17 +586,19 @@ def add_electrodes_to_nwbfile(
         data_to_add.pop("brain_area")
     else:
         # This is a required property and needs a default value
-        data = np.full(recording.get_num_channels(), fill_value="unknown")
+        data = np.full(num_channels, fill_value="unknown")
         data_to_add["location"] = dict(description="location", data=data, index=False)
 
     # Add missing groups to the nwb file
-    groupless_names = [group_name for group_name in group_names if group_name not in nwbfile.electrode_groups]
+    unique_group_names = list(dict.fromkeys(group_names.tolist()))
+    groupless_names = [group_name for group_name in unique_group_names if group_name not in nwbfile.electrode_groups]
     if len(groupless_names) > 0:
         electrode_group_list = [dict(name=group_name) for group_name in groupless_names]
         missing_group_metadata = dict(Ecephys=dict(ElectrodeGroup=electrode_group_list))
         add_electrode_groups_to_nwbfile(recording=recording, nwbfile=nwbfile, metadata=missing_group_metadata)
 
-    group_list = [nwbfile.electrode_groups[group_name] for group_name in group_names]
+    electrode_group_by_name = {group_name: nwbfile.electrode_groups[group_name] for group_name in unique_group_names}
+    group_list = [electrode_group_by_name[group_name] for group_name in group_names]
     data_to_add["group"] = dict(description="the ElectrodeGroup object", data=group_list, index=False)
 
     schema_properties = {"group", "group_name", "location"}
@@ -552,7 +613,7 @@ def add_electrodes_to_nwbfile(
     properties_requiring_null_values = electrode_table_previous_properties.difference(properties_to_add)
     nul_values_for_rows = dict()
     for property in properties_requiring_null_values:
-        sample_data = nwbfile.electrodes[property][:][0]
+        sample_data = nwbfile.electrodes[property][0]
         null_value = _get_null_value_for_property(
             property=property,
             sample_data=sample_data,
@@ -561,21 +622,26 @@ def add_electrodes_to_nwbfile(
         nul_values_for_rows[property] = null_value
 
     # We only add new electrodes to the table
-    existing_global_ids = _get_electrodes_table_global_ids(nwbfile=nwbfile)
-    channel_global_ids = [f"{ch_name}_{gr_name}" for ch_name, gr_name in zip(channel_names, group_names)]
+    existing_global_ids = set(_get_electrodes_table_global_ids(nwbfile=nwbfile))
+    channel_global_ids = _get_channel_global_ids(channel_names=channel_names, group_names=group_names)
     channel_indices_to_add = [index for index, key in enumerate(channel_global_ids) if key not in existing_global_ids]
 
+    # Gather the values of the rows column by column so they can be appended to the table in bulk
     properties_with_data = properties_to_add_by_rows.intersection(data_to_add)
-    for channel_index in channel_indices_to_add:
-        electrode_kwargs = nul_values_for_rows
-        data_dict = {property: data_to_add[property]["data"][channel_index] for property in properties_with_data}
-        electrode_kwargs.update(**data_dict)
-        nwbfile.add_electrode(**electrode_kwargs, enforce_unique_id=True)
+    num_rows_to_add = len(channel_indices_to_add)
+    rows_to_add = {
+        property: _take_channel_values(data=data_to_add[property]["data"], channel_indices=channel_indices_to_add)
+        for property in properties_with_data
+    }
+    rows_to_add.update(
+        {property: [null_value] * num_rows_to_add for property, null_value in nul_values_for_rows.items()}
+    )
+    _add_rows_to_electrodes_table(nwbfile=nwbfile, rows=rows_to_add, num_rows=num_rows_to_add)
 
     # The channel_name column as we use channel_name, group_name as a unique identifier
     # We fill previously inexistent values with the electrode table ids
-    electrode_table_size = len(nwbfile.electrodes.id[:])
-    previous_table_size = electrode_table_size - recording.get_num_channels()
+    electrode_table_size = len(nwbfile.electrodes)
+    previous_table_size = electrode_table_size - num_channels
 
     if "channel_name" in properties_to_add_by_columns:
         cols_args = data_to_add["channel_name"]
@@ -588,9 +654,10 @@ def add_electrodes_to_nwbfile(
         cols_args["data"] = extended_data
         nwbfile.add_electrode_column("channel_name", **cols_args)
 
-    all_indices = np.arange(electrode_table_size)
-    indices_for_new_data = _get_electrode_table_indices_for_recording(recording=recording, nwbfile=nwbfile)
-    indices_for_null_values = [index for index in all_indices if index not in indices_for_new_data]
+    indices_for_new_data = _get_electrode_table_indices_for_global_ids(
+        channel_global_ids=channel_global_ids, nwbfile=nwbfile
+    )
+    indices_for_null_values = np.setdiff1d(np.arange(electrode_table_size), indices_for_new_data)
     extending_column = len(indices_for_null_values) > 0
 
     # Add properties as columns
@@ -620,19 +687,81 @@ def add_electrodes_to_nwbfile(
 
             dtype = np.ndarray
             extended_data = np.empty(shape=electrode_table_size, dtype=dtype)
-            for index, value in enumerate(data):
-                index_in_extended_data = indices_for_new_data[index]
-                index_in_extended_data = indices_for_new_data[index]
+            for index_in_extended_data, value in zip(indices_for_new_data, data):
                 extended_data[index_in_extended_data] = value.tolist()
 
             for index in indices_for_null_values:
-                null_value = []
-                extended_data[index] = null_value
+                extended_data[index] = []
 
         cols_args["data"] = extended_data
         nwbfile.add_electrode_column(property, **cols_args)
 
 
+def _take_channel_values(data: Union[np.ndarray, list], channel_indices: list[int]) -> list:
+    """Gather the values of a channel property for the given channel indices, indexing arrays in a single call."""
+    if isinstance(data, np.ndarray):
+        return list(data[channel_indices])
+
+    return [data[channel_index] for channel_index in channel_indices]
+
+
+def _is_in_memory_column(column: VectorData) -> bool:
+    """Check whether a table column, and the target of a ragged column, hold their data as in-memory lists."""
+    if isinstance(column, VectorIndex):
+        return isinstance(column.data, list) and _is_in_memory_column(column=column.target)
+
+    return isinstance(column.data, list)
+
+
+def _add_rows_to_electrodes_table(nwbfile: pynwb.NWBFile, rows: dict[str, list], num_rows: int) -> None:
+    """
+    Append rows to the electrodes table of the NWBFile.
+
+    The first row is added with `nwbfile.add_electrode` so that pynwb creates the table and validates the required
+    columns. The remaining rows are appended column by column, avoiding the per-row validation overhead of
+    `DynamicTable.add_row`. If the table is not held in memory or the rows do not match its columns, the remaining
+    rows are added one at a time instead.
+
+    Parameters
+    ----------
+    nwbfile : pynwb.NWBFile
+        The NWBFile to which the electrodes are added.
+    rows : dict[str, list]
+        A dictionary mapping each column of the electrodes table to the list of values of the rows to add.
+    num_rows : int
+        The number of rows to add.
+    """
+    if num_rows == 0:
+        return
+
+    nwbfile.add_electrode(**{column: values[0] for column, values in rows.items()}, enforce_unique_id=True)
+
+    electrodes_table = nwbfile.electrodes
+    num_rows_in_table = len(electrodes_table)
+    new_ids = range(num_rows_in_table, num_rows_in_table + num_rows - 1)
+    columns = [electrodes_table[column_name] for column_name in electrodes_table.colnames]
+
+    can_extend_in_bulk = (
+        set(electrodes_table.colnames) == set(rows)
+        and isinstance(electrodes_table.id.data, list)
+        and all(_is_in_memory_column(column=column) for column in columns)
+        and set(new_ids).isdisjoint(electrodes_table.id.data)
+    )
+    if not can_extend_in_bulk:
+        for row in range(1, num_rows):
+            nwbfile.add_electrode(**{column: values[row] for column, values in rows.items()}, enforce_unique_id=True)
+        return
+
+    electrodes_table.id.extend(new_ids)
+    for column_name, column in zip(electrodes_table.colnames, columns):
+        values = rows[column_name][1:]
+        if isinstance(column, VectorIndex):
+            for value in values:
+                column.add_vector(value)
+        else:
+            column.extend(values)
+
+
 def check_if_recording_traces_fit_into_memory(recording: BaseRecording, segment_index: int = 0) -> None:
     """
     Raises an error if the full traces of a recording extractor are larger than psutil.virtual_memory().available.
@@ -663,6 +792,53 @@ def check_if_recording_traces_fit_into_memory(recording: BaseRecording, segment_
         raise MemoryError(message)
 
 
+def _iterate_recording_frames(
+    recording: BaseRecording, segment_index: int = 0, return_scaled: bool = False, block_mb: float = 10.0
+) -> Iterator[np.ndarray]:
+    """
+    Yield the frames of a recording segment one at a time while reading the traces in blocks of about `block_mb` MB.
+
+    Parameters
+    ----------
+    recording : spikeinterface.BaseRecording
+        A recording extractor from spikeinterface
+    segment_index : int, default: 0
+        The recording segment to iterate on.
+    return_scaled : bool, default: False
+        When True recording extractor objects from spikeinterface return their traces in microvolts.
+    block_mb : float, default: 10.0
+        The approximate size in megabytes (MB) of each block of traces read from the recording.
+
+    Yields
+    ------
+    np.ndarray
+        The traces of a single frame, with shape (num_channels,).
+    """
+    num_frames = recording.get_num_frames(segment_index=segment_index)
+    frame_size_in_bytes = recording.get_dtype().itemsize * recording.get_num_channels()
+    frames_per_block = max(1, int(block_mb * 1e6 / frame_size_in_bytes))
+
+    for start_frame in range(0, num_frames, frames_per_block):
+        traces = recording.get_traces(
+            segment_index=segment_index,
+            start_frame=start_frame,
+            end_frame=min(start_frame + frames_per_block, num_frames),
+            return_scaled=return_scaled,
+        )
+        yield from traces
+
+
+def _is_memory_mapped(array: np.ndarray) -> bool:
+    """Check whether an array is a view on a memory-mapped file, following the chain of arrays it was sliced from."""
+    base = array
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return True
+        base = getattr(base, "base", None)
+
+    return False
+
+
 def _recording_traces_to_hdmf_iterator(
     recording: BaseRecording,
     segment_index: int = None,
@@ -720,7 +896,13 @@ def _recording_traces_to_hdmf_iterator(
     iterator_opts = dict() if iterator_opts is None else iterator_opts
 
     if iterator_type is None:
-        check_if_recording_traces_fit_into_memory(recording=recording, segment_index=segment_index)
+        # Memory-mapped traces are views on the file, so they are written from the page cache without being copied
+        # into memory first and need not fit into it
+        first_frame = recording.get_traces(
+            start_frame=0, end_frame=1, return_scaled=return_scaled, segment_index=segment_index
+        )
+        if not _is_memory_mapped(array=first_frame):
+            check_if_recording_traces_fit_into_memory(recording=recording, segment_index=segment_index)
         traces_as_iterator = recording.get_traces(return_scaled=return_scaled, segment_index=segment_index)
     elif iterator_type == "v2":
         traces_as_iterator = SpikeInterfaceRecordingDataChunkIterator(
@@ -730,8 +912,13 @@ def _recording_traces_to_hdmf_iterator(
             **iterator_opts,
         )
     elif iterator_type == "v1":
+        num_frames = recording.get_num_frames(segment_index=segment_index)
+        maxshape = (num_frames, recording.get_num_channels())
         traces_as_iterator = DataChunkIterator(
-            data=recording.get_traces(return_scaled=return_scaled, segment_index=segment_index), **iterator_opts
+            data=_iterate_recording_frames(
+                recording=recording, segment_index=segment_index, return_scaled=return_scaled
+            ),
+            **{"maxshape": maxshape, **iterator_opts},
         )
     else:
         raise ValueError("iterator_type must be None, 'v1', or 'v2'.")
@@ -822,9 +1009,14 @@ def add_electrical_series_to_nwbfile(
     es_key : str, optional
         Key in metadata dictionary containing metadata info for the specific electrical series
     write_scaled : bool, default: False
-        If True, writes the traces in uV with the right conversion.
-        If False , the data is stored as it is and the right conversions factors are added to the nwbfile.
-        Only applies to compression="gzip". Controls the level of the GZIP.
+        If False, the data is stored as it is and the conversion factors from the channel gains and offsets of the
+        recording are added to the ElectricalSeries.
+        If True, what is stored depends on the gains of the recording:
+        - all channels share a finite gain: the data is stored as it is, with that gain and the offset as the
+          `conversion` and `offset` of the ElectricalSeries, exactly as if False.
+        - the gains differ across channels (or are not finite): the traces are scaled to floats in uV and stored
+          with a `conversion` of 1e-6 and no `channel_conversion` or `offset`.
+        - the recording has no gains: the data is stored as it is with a `conversion` of 1e-6.
     iterator_type: {"v2",  None}, default: 'v2'
         The type of DataChunkIterator to use.
         'v1' is the original DataChunkIterator of the hdmf data_utils.
@@ -907,22 +1099,31 @@ def add_electrical_series_to_nwbfile(
     channel_conversion = recording.get_channel_gains()
     channel_offset = recording.get_channel_offsets()
 
-    unique_channel_conversion = np.unique(channel_conversion)
-    unique_channel_conversion = unique_channel_conversion[0] if len(unique_channel_conversion) == 1 else None
+    unique_channel_conversion = None
+    if channel_conversion is not None and np.all(channel_conversion == channel_conversion[0]):
+        unique_channel_conversion = channel_conversion[0]
+
+    unique_offset = 0
+    if channel_offset is not None:
+        if not np.all(channel_offset == channel_offset[0]):
+            raise ValueError("Recording extractors with heterogeneous offsets are not supported")
+        unique_offset = channel_offset[0] if channel_offset[0] is not None else 0
 
-    unique_offset = np.unique(channel_offset)
-    if unique_offset.size > 1:
-        raise ValueError("Recording extractors with heterogeneous offsets are not supported")
-    unique_offset = unique_offset[0] if unique_offset[0] is not None else 0
+    # The unscaled traces with a uniform conversion factor hold the same values in Volts as the scaled traces in a
+    # fraction of the bytes, so the traces are only scaled to floats when a single finite gain is not available
+    gain_is_uniform_and_finite = unique_channel_conversion is not None and np.isfinite(unique_channel_conversion)
+    write_unscaled_traces = not write_scaled or channel_conversion is None or gain_is_uniform_and_finite
 
     micro_to_volts_conversion_factor = 1e-6
-    if not write_scaled and unique_channel_conversion is None:
+    if not write_unscaled_traces:
+        eseries_kwargs.update(conversion=micro_to_volts_conversion_factor)
+    elif unique_channel_conversion is None:
         eseries_kwargs.update(conversion=micro_to_volts_conversion_factor)
         eseries_kwargs.update(channel_conversion=channel_conversion)
-    elif not write_scaled and unique_channel_conversion is not None:
+    else:
         eseries_kwargs.update(conversion=unique_channel_conversion * micro_to_volts_conversion_factor)
 
-    if not write_scaled:
+    if write_unscaled_traces:
         eseries_kwargs.update(offset=unique_offset * micro_to_volts_conversion_factor)
 
     # Iterator
@@ -931,6 +1132,7 @@ def add_electrical_series_to_nwbfile(
         segment_index=segment_index,
         iterator_type=iterator_type,
         iterator_opts=iterator_opts,
+        return_scaled=not write_unscaled_traces,
     )
     eseries_kwargs.update(data=ephys_data_iterator)
 
@@ -1003,7 +1205,7 @@ def add_electrodes_info_to_nwbfile(recording: BaseRecording, nwbfile: pynwb.NWBF
         If no group information is passed via metadata, automatic linking to existing electrode groups,
         possibly including the default, will occur.
     """
-    add_devices_to_nwbfile(nwbfile=nwbfile, metadata=metadata)
+    # The devices are added by add_electrode_groups_to_nwbfile before the groups that link to them
     add_electrode_groups_to_nwbfile(recording=recording, nwbfile=nwbfile, metadata=metadata)
     add_electrodes_to_nwbfile(recording=recording, nwbfile=nwbfile, metadata=metadata)
 
@@ -1095,7 +1297,8 @@ def add_recording_to_nwbfile(
     write_electrical_series : bool, default=True
         If True, writes the ElectricalSeries to the NWBFile. If False, no ElectricalSeries is written.
     write_scaled : bool, default=False
-        If True, writes the traces in microvolts (uV) with the appropriate conversion.
+        If True, writes the traces in microvolts (uV) unless all channels share a finite gain, in which case the
+        data is stored as-is with that gain as the conversion (see `add_electrical_series_to_nwbfile`).
         If False, the data is stored as-is, and the correct conversion factors are added to the NWBFile.
     iterator_type : {'v2', None}, default='v2'
         The type of DataChunkIterator to use when writing data in chunks. Options are:
@@ -1511,7 +1714,7 @@ def add_units_table_to_nwbfile(
     properties_requiring_null_values = units_table_previous_properties.difference(properties_to_add)
     null_values_for_row = {}
     for property in properties_requiring_null_values - {"electrodes"}:  # TODO, fix electrodes
-        sample_data = units_table[property][:][0]
+        sample_data = units_table[property][0]
         null_value = _get_null_value_for_property(
             property=property,
             sample_data=sample_data,
@@ -1523,30 +1726,40 @@ def add_units_table_to_nwbfile(
     null_values_for_row["id"] = None
 
     # Add data by rows excluding the rows with previously added unit names
-    unit_names_used_previously = []
+    # Map each previous unit name to the first row that uses it
+    previous_unit_name_to_row = dict()
     if "unit_name" in units_table_previous_properties:
-        unit_names_used_previously = units_table["unit_name"].data
+        for index, unit_name in enumerate(units_table["unit_name"][:]):
+            previous_unit_name_to_row.setdefault(unit_name, index)
     has_electrodes_column = "electrodes" in units_table.colnames
 
     properties_with_data = {property for property in properties_to_add_by_rows if "data" in data_to_add[property]}
     rows_in_data = [index for index in range(sorting.get_num_units())]
     if not has_electrodes_column:
-        rows_to_add = [index for index in rows_in_data if unit_name_array[index] not in unit_names_used_previously]
+        rows_to_add = [index for index in rows_in_data if unit_name_array[index] not in previous_unit_name_to_row]
     else:
         rows_to_add = []
         for index in rows_in_data:
-            if unit_name_array[index] not in unit_names_used_previously:
+            if unit_name_array[index] not in previous_unit_name_to_row:
                 rows_to_add.append(index)
             else:
-                unit_name = unit_name_array[index]
-                previous_electrodes = units_table[np.where(units_table["unit_name"][:] == unit_name)[0]].electrodes
+                previous_row = previous_unit_name_to_row[unit_name_array[index]]
+                previous_electrodes = units_table[[previous_row]].electrodes
                 if list(previous_electrodes.values[0]) != list(unit_electrode_indices[index]):
                     rows_to_add.append(index)
 
+    row_values_by_property = {property: data_to_add[property]["data"] for property in properties_with_data}
+    if waveform_means is not None:
+        row_values_by_property["waveform_mean"] = waveform_means
+        if waveform_sds is not None:
+            row_values_by_property["waveform_sd"] = waveform_sds
+    if unit_electrode_indices is not None:
+        row_values_by_property["electrodes"] = unit_electrode_indices
+
     for row in rows_to_add:
-        unit_kwargs = null_values_for_row
-        for property in properties_with_data:
-            unit_kwargs[property] = data_to_add[property]["data"][row]
+        unit_kwargs = dict(null_values_for_row)
+        for property, values in row_values_by_property.items():
+            unit_kwargs[property] = values[row]
         spike_times = []
 
         # Extract and concatenate the spike times from multiple segments
@@ -1556,12 +1769,6 @@ def add_units_table_to_nwbfile(
             )
             spike_times.append(segment_spike_times)
         spike_times = np.concatenate(spike_times)
-        if waveform_means is not None:
-            unit_kwargs["waveform_mean"] = waveform_means[row]
-            if waveform_sds is not None:
-                unit_kwargs["waveform_sd"] = waveform_sds[row]
-        if unit_electrode_indices is not None:
-            unit_kwargs["electrodes"] = unit_electrode_indices[row]
 
         units_table.add_unit(spike_times=spike_times, **unit_kwargs, enforce_unique_id=True)
 
@@ -1579,14 +1786,13 @@ def add_units_table_to_nwbfile(
         cols_args["data"] = extended_data
         units_table.add_column("unit_name", **cols_args)
 
-    # Build  a channel name to electrode table index map
-    table_df = units_table.to_dataframe().reset_index()
-    unit_name_to_electrode_index = {
-        unit_name: table_df.query(f"unit_name=='{unit_name}'").index[0] for unit_name in unit_name_array
-    }
+    # Build a unit name to units table index map, keeping the first row that matches each name
+    unit_name_to_electrode_index = dict()
+    for index, unit_name in enumerate(units_table["unit_name"][:]):
+        unit_name_to_electrode_index.setdefault(unit_name, index)
 
     indices_for_new_data = [unit_name_to_electrode_index[unit_name] for unit_name in unit_name_array]
-    indices_for_null_values = table_df.index.difference(indices_for_new_data).values
+    indices_for_null_values = np.setdiff1d(np.arange(unit_table_size), indices_for_new_data)
     extending_column = len(indices_for_null_values) > 0
 
     # Add properties as columns
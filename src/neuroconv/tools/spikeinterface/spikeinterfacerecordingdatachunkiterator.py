@@ -1,3 +1,4 @@
+import math
 from typing import Iterable, Optional
 
 from spikeinterface import BaseRecording
@@ -81,10 +82,12 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
     def _get_default_chunk_shape(self, chunk_mb: float = 10.0) -> tuple[int, int]:
         assert chunk_mb > 0, f"chunk_mb ({chunk_mb}) must be greater than zero!"
 
-        chunk_channels = min(
-            self.recording.get_num_channels(),
-            64,  # from https://github.com/flatironinstitute/neurosift/issues/52#issuecomment-1671405249
-        )
+        # Split the channels into as few chunks of at most 64 channels as possible, of (nearly) equal size, so that
+        # the last chunk along the channel axis is not left mostly empty (e.g. 65 channels -> 33 + 32, not 64 + 1)
+        # 64 is from https://github.com/flatironinstitute/neurosift/issues/52#issuecomment-1671405249
+        num_channels = self.recording.get_num_channels()
+        num_channel_chunks = math.ceil(num_channels / 64)
+        chunk_channels = math.ceil(num_channels / num_channel_chunks)
         chunk_frames = min(
             self.recording.get_num_frames(segment_index=self.segment_index),
             int(chunk_mb * 1e6 / (self.recording.get_dtype().itemsize * chunk_channels)),
@@ -92,10 +95,29 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
 
         return (chunk_frames, chunk_channels)
 
+    def _get_default_buffer_shape(self, buffer_gb: float = 1.0) -> tuple[int, int]:
+        # Span every channel and a whole number of chunks along time, so each buffer is read from the recording in a
+        # single call and written as complete chunks
+        num_frames, num_channels = self.maxshape
+        chunk_frames = self.chunk_shape[0]
+        chunk_row_bytes = chunk_frames * num_channels * self.dtype.itemsize
+        chunk_rows_per_buffer = math.floor(buffer_gb * 1e9 / chunk_row_bytes)
+        if chunk_rows_per_buffer == 0:
+            return super()._get_default_buffer_shape(buffer_gb=buffer_gb)
+
+        buffer_frames = min(num_frames, chunk_rows_per_buffer * chunk_frames)
+
+        return (buffer_frames, num_channels)
+
     def _get_data(self, selection: tuple[slice]) -> Iterable:
+        # A selection spanning every channel is read as a contiguous block of frames
+        channel_ids = self.channel_ids[selection[1]]
+        if len(channel_ids) == len(self.channel_ids):
+            channel_ids = None
+
         return self.recording.get_traces(
             segment_index=self.segment_index,
-            channel_ids=self.channel_ids[selection[1]],
+            channel_ids=channel_ids,
             start_frame=selection[0].start,
             end_frame=selection[0].stop,
             return_scaled=self.return_scaled,
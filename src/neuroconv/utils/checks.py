@@ -9,7 +9,10 @@ def calculate_regular_series_rate(series: np.ndarray, tolerance_decimals: int =
     If the difference between all time points are all the same value, then the value of
     rate is a scalar otherwise it is None."""
     diff_ts = np.diff(series)
-    rounded_diff_ts = diff_ts.round(decimals=tolerance_decimals)
-    uniq_diff_ts = np.unique(rounded_diff_ts)
-    rate = 1.0 / diff_ts[0] if len(uniq_diff_ts) == 1 else None
+    if diff_ts.size == 0:
+        return None
+
+    first_diff = diff_ts[0]
+    rounded_diff_ts = np.round(diff_ts, decimals=tolerance_decimals, out=diff_ts)
+    rate = 1.0 / first_diff if rounded_diff_ts.min() == rounded_diff_ts.max() else None
     return rate
@@ -182,13 +182,42 @@ def dict_deep_update(
 
     if copy:
         dict_to_update = deepcopy(dict_to_update)
+    else:
+        # Only the top level is updated in place; the nested dictionaries of the input are never modified
+        for key_to_update, update_values in dict_with_update_values.items():
+            if isinstance(update_values, collections.abc.Mapping) and key_to_update in dict_to_update:
+                dict_to_update[key_to_update] = deepcopy(dict_to_update[key_to_update])
+
+    return _dict_deep_update_in_place(
+        dict_to_update,
+        dict_with_update_values,
+        append_list=append_list,
+        remove_repeats=remove_repeats,
+        compare_key=compare_key,
+        list_dict_deep_update=list_dict_deep_update,
+    )
+
+
+def _dict_deep_update_in_place(
+    d: collections.abc.Mapping,
+    u: collections.abc.Mapping,
+    append_list: bool = True,
+    remove_repeats: bool = True,
+    compare_key: str = "name",
+    list_dict_deep_update: bool = True,
+) -> collections.abc.Mapping:
+    """Perform the update of `dict_deep_update` on d and all its nested dictionaries without copying."""
+    dict_to_update, dict_with_update_values = d, u
+    if not isinstance(dict_to_update, collections.abc.Mapping):
+        warnings.warn("input to update should be a dict, returning output")
+        return dict_with_update_values
 
     for key_to_update, update_values in dict_with_update_values.items():
         # Update with a dict like object is recursive until an empty dict is found.
         if isinstance(update_values, collections.abc.Mapping):
             sub_dict_to_update = dict_to_update.get(key_to_update, dict())
             sub_dict_with_update_values = update_values
-            dict_to_update[key_to_update] = dict_deep_update(
+            dict_to_update[key_to_update] = _dict_deep_update_in_place(
                 sub_dict_to_update, sub_dict_with_update_values, append_list=append_list, remove_repeats=remove_repeats
             )
         # Update with list calls the append_replace_dict_in_list function
@@ -68,10 +68,12 @@ class TestVideoInterface(TestCase):
             frameSize=frameSize,
         )
 
+        rng = np.random.default_rng(seed=0)
+        frame_shape = (number_of_rows, number_of_columns, 3)
         for frame in range(number_of_frames):
-            writer1.write(np.random.randint(0, 255, (number_of_rows, number_of_columns, 3)).astype("uint8"))
-            writer2.write(np.random.randint(0, 255, (number_of_rows, number_of_columns, 3)).astype("uint8"))
-            writer3.write(np.random.randint(0, 255, (number_of_rows, number_of_columns, 3)).astype("uint8"))
+            writer1.write(rng.integers(low=0, high=255, size=frame_shape, dtype="uint8"))
+            writer2.write(rng.integers(low=0, high=255, size=frame_shape, dtype="uint8"))
+            writer3.write(rng.integers(low=0, high=255, size=frame_shape, dtype="uint8"))
 
         writer1.release()
         writer2.release()
@@ -136,7 +138,6 @@ class TestExternalVideoInterface(TestVideoInterface):
         with NWBHDF5IO(path=self.nwbfile_path, mode="r") as io:
             nwbfile = io.read()
             module = nwbfile.acquisition
-            metadata = self.nwb_converter.get_metadata()
             self.assertListEqual(list1=list(module["Video test1"].external_file[:]), list2=self.video_files[0:2])
             self.assertListEqual(list1=list(module["Video test3"].external_file[:]), list2=[self.video_files[2]])
 
@@ -260,8 +261,7 @@ class TestInternalVideoInterface(TestVideoInterface):
         with NWBHDF5IO(path=self.nwbfile_path, mode="r") as io:
             nwbfile = io.read()
             mod = nwbfile.acquisition
-            metadata = self.nwb_converter.get_metadata()
-            for video_metadata in metadata["Behavior"]["Video1"]:
+            for video_metadata in self.metadata["Behavior"]["Video1"]:
                 video_interface_name = video_metadata["name"]
                 assert mod[video_interface_name].data.chunks is not None  # TODO retrieve storage_layout of hdf5 dataset
 
@@ -283,8 +283,7 @@ class TestInternalVideoInterface(TestVideoInterface):
         with NWBHDF5IO(path=self.nwbfile_path, mode="r") as io:
             nwbfile = io.read()
             mod = nwbfile.acquisition
-            metadata = self.nwb_converter.get_metadata()
-            for video_index in range(len(metadata["Behavior"]["Video1"])):
-                video_interface_name = metadata["Behavior"]["Video1"][video_index]["name"]
+            for video_metadata in self.metadata["Behavior"]["Video1"]:
+                video_interface_name = video_metadata["name"]
                 assert mod[video_interface_name].data.shape[0] == 10
                 assert mod[video_interface_name].timestamps.shape[0] == 10
@@ -3,20 +3,21 @@ from datetime import datetime
 from pathlib import Path
 from shutil import rmtree
 from tempfile import mkdtemp
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import numpy as np
 import psutil
 import pynwb.ecephys
+from hdmf.common import DynamicTable, VectorData, VectorIndex
 from hdmf.data_utils import DataChunkIterator
 from hdmf.testing import TestCase
-from pynwb import NWBFile
+from pynwb import NWBHDF5IO, NWBFile
 from spikeinterface.core.generate import (
     generate_ground_truth_recording,
     generate_recording,
     generate_sorting,
 )
-from spikeinterface.extractors import NumpyRecording
+from spikeinterface.extractors import BinaryRecordingExtractor, NumpyRecording
 
 from neuroconv.tools.nwb_helpers import get_module
 from neuroconv.tools.spikeinterface import (
@@ -29,6 +30,10 @@ from neuroconv.tools.spikeinterface import (
     write_recording_to_nwbfile,
     write_sorting_analyzer_to_nwbfile,
 )
+from neuroconv.tools.spikeinterface.spikeinterface import (
+    _add_rows_to_electrodes_table,
+    _iterate_recording_frames,
+)
 from neuroconv.tools.spikeinterface.spikeinterfacerecordingdatachunkiterator import (
     SpikeInterfaceRecordingDataChunkIterator,
 )
@@ -352,6 +357,43 @@ class TestAddElectricalSeriesVoltsScaling(unittest.TestCase):
         traces_data_in_volts = self.test_recording_extractor.get_traces(segment_index=0, return_scaled=True) * 1e-6
         np.testing.assert_array_almost_equal(data_in_volts, traces_data_in_volts)
 
+    def test_write_scaled_with_uniform_gains_stores_unscaled_traces(self):
+        gains = self.gains_uniform
+        offsets = self.offsets_uniform
+        self.test_recording_extractor.set_channel_gains(gains=gains)
+        self.test_recording_extractor.set_channel_offsets(offsets=offsets)
+
+        add_electrical_series_to_nwbfile(
+            recording=self.test_recording_extractor, nwbfile=self.nwbfile, iterator_type=None, write_scaled=True
+        )
+
+        electrical_series = self.nwbfile.acquisition["ElectricalSeriesRaw"]
+        assert electrical_series.conversion == 2e-6
+        assert electrical_series.offset == offsets[0] * 1e-6
+
+        extracted_data = electrical_series.data[:]
+        traces_data = self.test_recording_extractor.get_traces(segment_index=0, return_scaled=False)
+        np.testing.assert_array_equal(extracted_data, traces_data)
+
+    def test_write_scaled_with_variable_gains_stores_scaled_traces(self):
+        gains = self.gains_variable
+        offsets = self.offsets_uniform
+        self.test_recording_extractor.set_channel_gains(gains=gains)
+        self.test_recording_extractor.set_channel_offsets(offsets=offsets)
+
+        add_electrical_series_to_nwbfile(
+            recording=self.test_recording_extractor, nwbfile=self.nwbfile, iterator_type=None, write_scaled=True
+        )
+
+        electrical_series = self.nwbfile.acquisition["ElectricalSeriesRaw"]
+        assert electrical_series.conversion == 1e-6
+        assert electrical_series.offset == 0
+        assert electrical_series.channel_conversion is None
+
+        extracted_data = electrical_series.data[:]
+        traces_data_in_micro_volts = self.test_recording_extractor.get_traces(segment_index=0, return_scaled=True)
+        np.testing.assert_array_almost_equal(extracted_data, traces_data_in_micro_volts)
+
     def test_null_offsets_in_recording_extractor(self):
         gains = self.gains_default
         self.test_recording_extractor.set_channel_gains(gains=gains)
@@ -447,6 +489,20 @@ class TestAddElectricalSeriesChunking(unittest.TestCase):
 
         assert electrical_series_data_iterator.chunk_shape == iterator_opts["chunk_shape"]
 
+    def test_default_chunk_shape_splits_channels_evenly(self):
+        recording = generate_recording(num_channels=65, durations=[1.0])
+        iterator = SpikeInterfaceRecordingDataChunkIterator(recording=recording)
+
+        assert iterator.chunk_shape[1] == 33
+
+    def test_default_buffer_shape_spans_channels_in_whole_chunks(self):
+        recording = generate_recording(num_channels=65, durations=[10.0])
+        iterator = SpikeInterfaceRecordingDataChunkIterator(
+            recording=recording, chunk_shape=(3_000, 33), buffer_gb=0.01
+        )
+
+        assert iterator.buffer_shape == (36_000, 65)
+
     def test_hdmf_iterator(self):
         add_electrical_series_to_nwbfile(
             recording=self.test_recording_extractor, nwbfile=self.nwbfile, iterator_type="v1"
@@ -462,6 +518,32 @@ class TestAddElectricalSeriesChunking(unittest.TestCase):
         expected_data = self.test_recording_extractor.get_traces(segment_index=0)
         np.testing.assert_array_almost_equal(expected_data, extracted_data)
 
+    def test_hdmf_iterator_written_data(self):
+        recording = generate_recording(sampling_frequency=10.0, num_channels=3, durations=[5.0])
+        add_electrical_series_to_nwbfile(
+            recording=recording, nwbfile=self.nwbfile, iterator_type="v1", iterator_opts=dict(buffer_size=7)
+        )
+
+        folder_path = Path(mkdtemp())
+        self.addCleanup(rmtree, folder_path, ignore_errors=True)
+        nwbfile_path = folder_path / "test_hdmf_iterator_written_data.nwb"
+        with NWBHDF5IO(path=nwbfile_path, mode="w") as io:
+            io.write(self.nwbfile)
+
+        with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+            written_data = io.read().acquisition["ElectricalSeriesRaw"].data[:]
+
+        np.testing.assert_array_equal(written_data, recording.get_traces(segment_index=0))
+
+    def test_iterate_recording_frames_across_partial_block(self):
+        recording = generate_recording(sampling_frequency=10.0, num_channels=3, durations=[5.0])
+        frame_size_in_bytes = recording.get_dtype().itemsize * recording.get_num_channels()
+        block_mb = 7.5 * frame_size_in_bytes / 1e6  # 7 frames per block, which does not divide the 50 frames
+
+        frames = list(_iterate_recording_frames(recording=recording, block_mb=block_mb))
+
+        np.testing.assert_array_equal(np.stack(frames), recording.get_traces(segment_index=0))
+
     def test_non_iterative_write(self):
         add_electrical_series_to_nwbfile(
             recording=self.test_recording_extractor, nwbfile=self.nwbfile, iterator_type=None
@@ -493,6 +575,23 @@ class TestAddElectricalSeriesChunking(unittest.TestCase):
         with self.assertRaisesRegex(MemoryError, reg_expression):
             check_if_recording_traces_fit_into_memory(recording=mock_recorder)
 
+    def test_non_iterative_write_of_memory_mapped_traces_skips_memory_check(self):
+        folder_path = Path(mkdtemp())
+        self.addCleanup(rmtree, folder_path, ignore_errors=True)
+        file_path = folder_path / "traces.bin"
+        traces = np.arange(60, dtype="int16").reshape(20, 3)
+        traces.tofile(file_path)
+        recording = BinaryRecordingExtractor(
+            file_paths=[file_path], sampling_frequency=1.0, num_channels=3, dtype="int16"
+        )
+
+        # Even with no memory available the memory-mapped traces are written without loading them
+        with patch("psutil.virtual_memory", return_value=Mock(available=0)):
+            add_electrical_series_to_nwbfile(recording=recording, nwbfile=self.nwbfile, iterator_type=None)
+
+        electrical_series = self.nwbfile.acquisition["ElectricalSeriesRaw"]
+        np.testing.assert_array_equal(electrical_series.data, traces)
+
     def test_invalid_iterator_type_assertion(self):
         iterator_type = "invalid_iterator_type"
 
@@ -1038,6 +1137,79 @@ class TestAddElectrodes(TestCase):
         assert np.array_equal(extracted_incomplete_property, expected_incomplete_property)
 
 
+class TestAddRowsToElectrodesTable(TestCase):
+    def setUp(self):
+        self.nwbfile = NWBFile(
+            session_description="session_description1", identifier="file_id1", session_start_time=testing_session_time
+        )
+        device = self.nwbfile.create_device(name="device")
+        self.electrode_group = self.nwbfile.create_electrode_group(
+            name="0", description="description", location="location", device=device
+        )
+        self.rows = dict(
+            location=["c", "d", "e"],
+            group=[self.electrode_group] * 3,
+            group_name=["0"] * 3,
+            ragged_property=[[2], [3, 4], [5, 6, 7]],
+        )
+
+    def _add_existing_rows(self, nwbfile):
+        nwbfile.add_electrode_column(name="ragged_property", description="", index=True)
+        for location, ragged_value in zip(["a", "b"], [[0], [0, 1]]):
+            nwbfile.add_electrode(
+                location=location, group=self.electrode_group, group_name="0", ragged_property=ragged_value
+            )
+
+    def _get_reference_table_values(self):
+        reference_nwbfile = NWBFile(
+            session_description="session_description1", identifier="file_id1", session_start_time=testing_session_time
+        )
+        self._add_existing_rows(nwbfile=reference_nwbfile)
+        for row in range(3):
+            reference_nwbfile.add_electrode(**{column: values[row] for column, values in self.rows.items()})
+
+        return self._get_table_values(electrodes_table=reference_nwbfile.electrodes)
+
+    @staticmethod
+    def _get_table_values(electrodes_table):
+        table_values = {
+            column_name: list(electrodes_table[column_name][:]) for column_name in electrodes_table.colnames
+        }
+        table_values["group"] = [group.name for group in table_values["group"]]
+        table_values["id"] = list(electrodes_table.id[:])
+        return table_values
+
+    def test_rows_are_added_in_bulk_to_in_memory_table(self):
+        self._add_existing_rows(nwbfile=self.nwbfile)
+
+        with patch.object(self.nwbfile, "add_electrode", wraps=self.nwbfile.add_electrode) as add_electrode:
+            _add_rows_to_electrodes_table(nwbfile=self.nwbfile, rows=self.rows, num_rows=3)
+
+        assert add_electrode.call_count == 1
+        assert self._get_table_values(electrodes_table=self.nwbfile.electrodes) == self._get_reference_table_values()
+
+    def test_rows_are_added_one_at_a_time_to_array_backed_table(self):
+        ragged_property = VectorData(name="ragged_property", description="", data=[0, 0, 1])
+        self.nwbfile.electrodes = DynamicTable(
+            name="electrodes",
+            description="metadata about extracellular electrodes",
+            id=np.array([0, 1]),
+            columns=[
+                VectorData(name="location", description="", data=np.array(["a", "b"])),
+                VectorData(name="group", description="", data=np.array([self.electrode_group] * 2, dtype=object)),
+                VectorData(name="group_name", description="", data=np.array(["0", "0"])),
+                ragged_property,
+                VectorIndex(name="ragged_property_index", data=[1, 3], target=ragged_property),
+            ],
+        )
+
+        with patch.object(self.nwbfile, "add_electrode", wraps=self.nwbfile.add_electrode) as add_electrode:
+            _add_rows_to_electrodes_table(nwbfile=self.nwbfile, rows=self.rows, num_rows=3)
+
+        assert add_electrode.call_count == 3
+        assert self._get_table_values(electrodes_table=self.nwbfile.electrodes) == self._get_reference_table_values()
+
+
 class TestAddUnitsTable(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -1085,6 +1257,20 @@ class TestAddUnitsTable(TestCase):
         unit_names_in_units_table = list(self.nwbfile.units["unit_name"].data)
         self.assertListEqual(unit_names_in_units_table, expected_unit_names_in_units_table)
 
+    def test_unit_names_with_quotes_property_extension(self):
+        """Unit names containing quotes should be matched to their rows when extending a property column."""
+        unit_names = ["unit 'a'", 'unit "b"', "unit c", "unit d"]
+        self.sorting_1.set_property(key="unit_name", values=unit_names)
+        add_units_table_to_nwbfile(sorting=self.sorting_1, nwbfile=self.nwbfile)
+
+        self.sorting_2.set_property(key="unit_name", values=unit_names[2:] + ["unit e", "unit f"])
+        self.sorting_2.set_property(key="added_property", values=["added_value"] * self.num_units)
+        add_units_table_to_nwbfile(sorting=self.sorting_2, nwbfile=self.nwbfile)
+
+        properties_in_units_table = list(self.nwbfile.units["added_property"].data)
+        expected_properties_in_units_table = ["", "", "added_value", "added_value", "added_value", "added_value"]
+        self.assertListEqual(properties_in_units_table, expected_properties_in_units_table)
+
     def test_integer_unit_names_overwrite(self):
         """Ensure unit names merge correctly after appending when unit names are integers."""
         unit_ids = self.base_sorting.get_unit_ids()
@@ -229,3 +229,50 @@ def test_raise_error_when_metadata_is_empty_and_creation_is_needed(tmpdir):
     with pytest.raises(ValueError):
         with make_or_load_nwbfile(nwbfile_path=nwbfile_path, metadata=None, overwrite=True) as nwbfile:
             pass
+
+
+def test_configure_hdf5_metadata_cache(tmpdir):
+    from neuroconv.tools.nwb_helpers._metadata_and_file_helpers import (
+        _configure_hdf5_metadata_cache,
+    )
+
+    cache_size_in_bytes = 64 * 1024**2
+    with h5py.File(name=tmpdir / "test_configure_hdf5_metadata_cache.h5", mode="w") as file:
+        _configure_hdf5_metadata_cache(file=file, cache_size_in_bytes=cache_size_in_bytes)
+        cache_config = file.id.get_mdc_config()
+
+    assert cache_config.min_size == cache_size_in_bytes
+    assert cache_config.max_size == cache_size_in_bytes
+    assert cache_config.incr_mode == 0
+    assert cache_config.decr_mode == 0
+
+
+def test_make_or_load_nwbfile_hdf5_chunk_cache(tmpdir):
+    from neuroconv.tools.nwb_helpers._metadata_and_file_helpers import (
+        _HDF5_CHUNK_CACHE_NBYTES,
+        _HDF5_CHUNK_CACHE_NSLOTS,
+    )
+
+    nwbfile_path = tmpdir / "test_make_or_load_nwbfile_hdf5_chunk_cache.nwb"
+    with patch("h5py.File", wraps=h5py.File) as file_class:
+        with make_or_load_nwbfile(nwbfile_path=nwbfile_path, nwbfile=mock_NWBFile(), overwrite=True) as nwbfile:
+            nwbfile.add_acquisition(mock_TimeSeries())
+
+    _, file_kwargs = file_class.call_args_list[0]
+    assert file_kwargs["rdcc_nbytes"] == _HDF5_CHUNK_CACHE_NBYTES
+    assert file_kwargs["rdcc_nslots"] == _HDF5_CHUNK_CACHE_NSLOTS
+
+
+def test_make_or_load_nwbfile_closes_hdf5_file_when_io_creation_fails(tmpdir):
+    nwbfile_path = tmpdir / "test_make_or_load_nwbfile_closes_hdf5_file_when_io_creation_fails.nwb"
+    with patch(
+        "neuroconv.tools.nwb_helpers._metadata_and_file_helpers._configure_hdf5_metadata_cache",
+        side_effect=RuntimeError("Failed to configure the cache"),
+    ):
+        with pytest.raises(RuntimeError, match="Failed to configure the cache"):
+            with make_or_load_nwbfile(nwbfile_path=nwbfile_path, nwbfile=mock_NWBFile(), overwrite=True):
+                pass
+
+    # The file can only be truncated again if the handle from the failed attempt was closed
+    with h5py.File(name=nwbfile_path, mode="w"):
+        pass
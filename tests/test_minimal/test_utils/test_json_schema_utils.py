@@ -56,6 +56,26 @@ def test_dict_deep_update_2():
     compare_dicts(result2, correct_result)
 
 
+def test_dict_deep_update_does_not_modify_nested_input():
+    a = dict(a=dict(b=dict(c=dict(d=dict(e=1)))))
+    b = dict(a=dict(b=dict(c=dict(d=dict(e=2, f=3)))))
+    result = dict_deep_update(a, b)
+
+    compare_dicts(result, dict(a=dict(b=dict(c=dict(d=dict(e=2, f=3))))))
+    compare_dicts(a, dict(a=dict(b=dict(c=dict(d=dict(e=1))))))
+
+
+def test_dict_deep_update_without_copy_does_not_modify_nested_input():
+    nested = dict(b=dict(c=dict(d=dict(e=1))))
+    a = dict(a=nested)
+    b = dict(a=dict(b=dict(c=dict(d=dict(e=2, f=3)))))
+    result = dict_deep_update(a, b, copy=False)
+
+    assert result is a
+    compare_dicts(result, dict(a=dict(b=dict(c=dict(d=dict(e=2, f=3))))))
+    compare_dicts(nested, dict(b=dict(c=dict(d=dict(e=1)))))
+
+
 def test_dict_deep_update_3():
     # 3.1 test merge of dicts with a key's value as a list of int/str
     a1 = dict(a=1, b="hello", c=23)
@@ -4,3 +4,7 @@ from neuroconv.utils import calculate_regular_series_rate
 def test_check_regular_series():
     assert calculate_regular_series_rate(series=[1, 2, 3])
     assert not calculate_regular_series_rate(series=[1, 2, 4])
+
+
+def test_calculate_regular_series_rate_single_timestamp():
+    assert calculate_regular_series_rate(series=[1.0]) is None